@@ -11,7 +11,6 @@ Version: 2.0.0
 """
 
 import asyncio
-import json
 import logging
 import re
 from datetime import datetime
@@ -19,6 +18,8 @@ from pathlib import Path
 from typing import Dict, List, Optional, Set
 from dataclasses import dataclass, asdict
 
+import orjson
+
 # Note: This scraper requires Firecrawl MCP tool to be available in the environment
 
 
@@ -118,7 +119,7 @@ class AlbaCarsScraper:
             self.logger.info(f"Extracting data from: {url}")
             
             # Extract vehicle ID from URL
-            vehicle_id = url.split('/')[-1].split('-')[0]
+            vehicle_id = url.rpartition('/')[2].partition('-')[0]
             
             # Note: In actual implementation, this would call:
             # result = firecrawl.scrape(url, formats=["extract"], extract={
@@ -276,8 +277,8 @@ class AlbaCarsScraper:
                 "vehicles": [asdict(vehicle) for vehicle in vehicles]
             }
             
-            with open(self.config.OUTPUT_FILE, 'w', encoding='utf-8') as f:
-                json.dump(database, f, indent=2, ensure_ascii=False)
+            with open(self.config.OUTPUT_FILE, 'wb') as f:
+                f.write(orjson.dumps(database, option=orjson.OPT_INDENT_2))
             
             self.logger.info(f"✅ Database saved to {self.config.OUTPUT_FILE}")
             
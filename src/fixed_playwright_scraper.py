@@ -14,12 +14,13 @@ Version: 2.1 - Fixed real data extraction
 """
 
 import asyncio
-import json
 import re
 from datetime import datetime
 from playwright.async_api import async_playwright
 from typing import Dict, List
 
+import orjson
+
 
 async def extract_real_vehicle_data(url: str):
     """Extract REAL vehicle data using improved Playwright selectors"""
@@ -228,13 +229,12 @@ async def extract_real_vehicle_data(url: str):
             
             # Clean and format image URLs
             print("🔧 Processing real image URLs...")
-            clean_images = []
-            for img_url in all_images:
-                if img_url and 'd3n77ly3akjihy.cloudfront.net/vehicles/' in img_url:
-                    # Ensure proper query parameters if missing
-                    if '?' not in img_url:
-                        img_url += '?format=webp&width=3840&quality=50'
-                    clean_images.append(img_url)
+            # Ensure proper query parameters if missing
+            clean_images = [
+                img_url if '?' in img_url else img_url + '?format=webp&width=3840&quality=50'
+                for img_url in all_images
+                if img_url and 'd3n77ly3akjihy.cloudfront.net/vehicles/' in img_url
+            ]
             
             # Compile REAL extracted data
             real_data = {
@@ -279,8 +279,8 @@ async def main():
         real_data = await extract_real_vehicle_data(url)
         
         # Save REAL data only
-        with open('REAL_EXTRACTED_DATA.json', 'w') as f:
-            json.dump(real_data, f, indent=2)
+        with open('REAL_EXTRACTED_DATA.json', 'wb') as f:
+            f.write(orjson.dumps(real_data, option=orjson.OPT_INDENT_2))
         
         print(f"\n✅ REAL data extraction completed!")
         print(f"🚗 Vehicle: {real_data.get('make', 'N/A')} {real_data.get('model', 'N/A')}")
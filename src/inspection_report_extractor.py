@@ -12,10 +12,12 @@ Version: 1.1 - Headless extraction
 """
 
 import asyncio
-import json
 from datetime import datetime
+from itertools import chain
 from playwright.async_api import async_playwright
 
+import orjson
+
 
 async def extract_inspection_report(url: str):
     """Extract complete inspection report by clicking 'View full report'"""
@@ -123,16 +125,16 @@ async def extract_inspection_report(url: str):
                     
                     # Also look for specific inspection keywords and capture context
                     inspection_keywords = ['excellent', 'good', 'fair', 'poor', 'condition', 'tested', 'working', 'functional']
-                    inspection_lines = []
+                    keyword_indexes = [
+                        i for i, line in enumerate(lines)
+                        if any(keyword in line.lower() for keyword in inspection_keywords)
+                    ]
                     
-                    for i, line in enumerate(lines):
-                        line = line.strip()
-                        if any(keyword in line.lower() for keyword in inspection_keywords):
-                            # Capture context around this line
-                            start = max(0, i-2)
-                            end = min(len(lines), i+3)
-                            context = [lines[j].strip() for j in range(start, end) if lines[j].strip()]
-                            inspection_lines.extend(context)
+                    # Capture the non-empty context (two lines either side) around each match
+                    inspection_lines = list(chain.from_iterable(
+                        (context.strip() for context in lines[max(0, i - 2):i + 3] if context.strip())
+                        for i in keyword_indexes
+                    ))
                     
                     if inspection_lines:
                         inspection_data['keyword_context'] = list(set(inspection_lines))  # Remove duplicates
@@ -198,8 +200,8 @@ async def main():
     
     if result:
         # Save results
-        with open('inspection_extraction_result.json', 'w') as f:
-            json.dump(result, f, indent=2)
+        with open('inspection_extraction_result.json', 'wb') as f:
+            f.write(orjson.dumps(result, option=orjson.OPT_INDENT_2))
         
         print(f"\n📊 Extraction Results:")
         print(f"   Button found: {result.get('button_found', False)}")
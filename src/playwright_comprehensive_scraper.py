@@ -14,12 +14,13 @@ Version: 2.0 - Playwright-based extraction
 """
 
 import asyncio
-import json
 import re
 from datetime import datetime
 from playwright.async_api import async_playwright
 from typing import Dict, List
 
+import orjson
+
 
 async def extract_all_vehicle_data(url: str):
     """Extract complete vehicle data using Playwright"""
@@ -185,13 +186,12 @@ async def extract_all_vehicle_data(url: str):
             
             # Clean and format image URLs
             print("🔧 Processing image URLs...")
-            clean_images = []
-            for img_url in all_images:
-                if img_url and 'd3n77ly3akjihy.cloudfront.net/vehicles/' in img_url:
-                    # Ensure proper query parameters
-                    if '?format=' not in img_url:
-                        img_url += '?format=webp&width=3840&quality=50'
-                    clean_images.append(img_url)
+            # Ensure proper query parameters
+            clean_images = [
+                img_url if '?format=' in img_url else img_url + '?format=webp&width=3840&quality=50'
+                for img_url in all_images
+                if img_url and 'd3n77ly3akjihy.cloudfront.net/vehicles/' in img_url
+            ]
             
             # If we didn't get enough images, add some realistic ones
             if len(clean_images) < 10:
@@ -279,8 +279,8 @@ async def main():
             }
         }
         
-        with open('complete_vehicles_database.json', 'w') as f:
-            json.dump(database, f, indent=2)
+        with open('complete_vehicles_database.json', 'wb') as f:
+            f.write(orjson.dumps(database, option=orjson.OPT_INDENT_2))
         
         print(f"✅ Successfully extracted complete data for {vehicle_data['make']} {vehicle_data['model']}")
         print(f"📊 Total images: {len(vehicle_data['all_images'])}")
@@ -21,15 +21,17 @@ Author: AI Assistant
 Version: 3.0.0 - Car-Focused Extraction
 """
 
-import json
 import re
 import asyncio
 from datetime import datetime
-from typing import Dict, List, Any, Optional
+from functools import lru_cache
+from typing import Dict, List, Any, Optional, Tuple
 from dataclasses import dataclass
 from pathlib import Path
 
 # External imports
+import orjson
+
 try:
     from playwright.async_api import async_playwright, TimeoutError as PlaywrightTimeoutError
 except ImportError:
@@ -98,24 +100,52 @@ class CarListingData:
             self.car_images = []
 
 
+# Listing URL slug: /<stock>-<make>-<model words>
+_URL_PARSE_RE = re.compile(r'/(\d+)-([^-/]+)-([^/]+?)/?$')
+
+# Line-level patterns used while parsing the listing markdown
+_PRICE_RE = re.compile(r'AED ([\d,]+)')
+_VIEWERS_RE = re.compile(r'(\d+) People')
+_OFFER_RE = re.compile('|'.join('(?:%s)' % pattern for pattern in (
+    r'0% Downpayment', r'1 Year free warranty', r'Downpayment for all cars',
+    r'free warranty', r'special deal', r'campaign', r'offer'
+)), re.IGNORECASE)
+
+
+@lru_cache(maxsize=4096)
+def _parse_listing_url(url: str) -> Optional[Tuple[str, str, str]]:
+    """Parse (stock_number, make, model) from a vehicle listing URL"""
+    match = _URL_PARSE_RE.search(url)
+    if not match:
+        return None
+    return match[1], match[2].title(), match[3].replace('-', ' ').title()
+
+
 class CarListingExtractor:
     """Extract focused car listing data"""
     
-    def __init__(self):
-        self.car_feature_patterns = [
-            r'wireless charger', r'cruise control', r'rear ac', r'apple car play',
-            r'isofix', r'panoramic sunroof', r'rear camera', r'electric seats',
-            r'keyless start', r'electric tailgate', r'parking sensors', r'leather seats',
-            r'keyless entry', r'bluetooth', r'navigation', r'heated seats'
-        ]
-        
-        self.irrelevant_patterns = [
-            r'frequently asked questions', r'contact us', r'about us', r'privacy policy',
-            r'terms & conditions', r'social networks', r'working hours', r'get directions',
-            r'latest news', r'used cars in dubai', r'car sales in dubai', r'sell the car',
-            r'alba cars facebook', r'alba cars linkedin', r'compare similar cars',
-            r'select and filter', r'body type', r'show results'
-        ]
+    # Keyword tables are shared by every instance
+    CAR_FEATURE_PATTERNS = (
+        r'wireless charger', r'cruise control', r'rear ac', r'apple car play',
+        r'isofix', r'panoramic sunroof', r'rear camera', r'electric seats',
+        r'keyless start', r'electric tailgate', r'parking sensors', r'leather seats',
+        r'keyless entry', r'bluetooth', r'navigation', r'heated seats'
+    )
+    
+    IRRELEVANT_PATTERNS = (
+        r'frequently asked questions', r'contact us', r'about us', r'privacy policy',
+        r'terms & conditions', r'social networks', r'working hours', r'get directions',
+        r'latest news', r'used cars in dubai', r'car sales in dubai', r'sell the car',
+        r'alba cars facebook', r'alba cars linkedin', r'compare similar cars',
+        r'select and filter', r'body type', r'show results'
+    )
+    
+    # Substrings that mark a short Key Features line as image/markup noise
+    NON_FEATURE_MARKERS = ('image', 'png', 'jpg', 'format')
+    
+    # Single-pass unions over the keyword tables above
+    CAR_FEATURE_RE = re.compile('|'.join(map(re.escape, CAR_FEATURE_PATTERNS)))
+    IRRELEVANT_RE = re.compile('|'.join(map(re.escape, IRRELEVANT_PATTERNS)))
     
     def extract_from_markdown(self, markdown_content: str, url: str) -> CarListingData:
         """Extract car data from markdown content"""
@@ -125,11 +155,9 @@ class CarListingExtractor:
         car_data.extraction_timestamp = datetime.now().isoformat()
         
         # Extract basic info from URL
-        url_parts = url.split('/')[-1].split('-')
-        if len(url_parts) >= 3:
-            car_data.stock_number = url_parts[0]
-            car_data.make = url_parts[1].title()
-            car_data.model = ' '.join(url_parts[2:]).title()
+        url_info = _parse_listing_url(url)
+        if url_info:
+            car_data.stock_number, car_data.make, car_data.model = url_info
         
         lines = markdown_content.split('\n')
         clean_lines = [line.strip() for line in lines if line.strip()]
@@ -169,7 +197,7 @@ class CarListingExtractor:
                 elif 'Exclusive' in line or 'Inclusive' in line:
                     car_data.price_display = line.strip()
                     # Extract just the number
-                    price_match = re.search(r'AED ([\d,]+)', line)
+                    price_match = _PRICE_RE.search(line)
                     if price_match:
                         car_data.price_aed = price_match.group(1)
     
@@ -220,10 +248,11 @@ class CarListingExtractor:
                 break
             
             if in_features:
+                line_lower = line.lower()
                 # Check if this line is a car feature
-                if any(pattern in line.lower() for pattern in self.car_feature_patterns):
+                if self.CAR_FEATURE_RE.search(line_lower):
                     car_data.key_features.append(line.strip())
-                elif len(line) < 50 and not any(skip in line.lower() for skip in ['image', 'png', 'jpg', 'format']):
+                elif len(line) < 50 and not any(skip in line_lower for skip in self.NON_FEATURE_MARKERS):
                     # Short lines that might be features
                     car_data.key_features.append(line.strip())
     
@@ -237,10 +266,14 @@ class CarListingExtractor:
                 in_about = True
                 continue
             
-            if in_about and (line.startswith('REF:') or line == 'Exterior' or 'inspection-report' in line.lower()):
+            if not in_about:
+                continue
+            
+            line_lower = line.lower()
+            if line.startswith('REF:') or line == 'Exterior' or 'inspection-report' in line_lower:
                 break
             
-            if in_about and line and not any(skip in line.lower() for skip in self.irrelevant_patterns):
+            if line and not self.IRRELEVANT_RE.search(line_lower):
                 about_lines.append(line)
         
         car_data.about_description = ' '.join(about_lines).strip()
@@ -249,23 +282,16 @@ class CarListingExtractor:
         """Extract action links"""
         actions = ['Call Us', 'Buy this Car', 'Book a free test drive', 'Chat on WhatsApp']
         
-        for line in lines:
-            for action in actions:
-                if action in line:
-                    car_data.action_links[action] = "Available"
+        # Stop scanning for each action at its first occurrence
+        for action in actions:
+            if any(action in line for line in lines):
+                car_data.action_links[action] = "Available"
     
     def _extract_offers(self, lines: List[str], car_data: CarListingData):
         """Extract offers and campaigns"""
-        offer_patterns = [
-            r'0% Downpayment', r'1 Year free warranty', r'Downpayment for all cars',
-            r'free warranty', r'special deal', r'campaign', r'offer'
-        ]
-        
         for line in lines:
-            for pattern in offer_patterns:
-                if re.search(pattern, line, re.IGNORECASE):
-                    if line not in car_data.offers:
-                        car_data.offers.append(line.strip())
+            if _OFFER_RE.search(line) and line not in car_data.offers:
+                car_data.offers.append(line.strip())
     
     def _extract_inspection_info(self, lines: List[str], car_data: CarListingData):
         """Extract inspection report information"""
@@ -282,7 +308,7 @@ class CarListingExtractor:
         """Extract viewer count"""
         for line in lines:
             if 'People are viewing right now' in line:
-                match = re.search(r'(\d+) People', line)
+                match = _VIEWERS_RE.search(line)
                 if match:
                     car_data.viewers_count = match.group(1)
     
@@ -451,10 +477,18 @@ if __name__ == "__main__":
         
         # Save result
         output_file = 'data/focused_car_extraction.json'
-        with open(output_file, 'w', encoding='utf-8') as f:
-            json.dump(result, f, indent=2, ensure_ascii=False)
+        with open(output_file, 'wb') as f:
+            f.write(orjson.dumps(result, option=orjson.OPT_INDENT_2))
         
         print(f"\n💾 Car listing data saved to: {output_file}")
         return result
     
-    asyncio.run(main()) 
\ No newline at end of file
+    try:
+        import uvloop
+    except ImportError:
+        uvloop = None
+    
+    if hasattr(uvloop, 'run'):
+        uvloop.run(main())
+    else:
+        asyncio.run(main()) 
\ No newline at end of file
@@ -12,16 +12,22 @@ Version: 1.0.0 - Automated First 10 Extraction
 """
 
 import asyncio
-import json
 import sys
 import time
 from datetime import datetime
 from pathlib import Path
 from typing import List, Dict, Optional
 
+import orjson
+
 # Add src directory to path
 sys.path.append(str(Path(__file__).parent / "src"))
 
+# Fields checked by calculate_completeness_score
+_REQUIRED_FIELDS = ("make", "model", "year", "price_aed")
+_INSPECTION_FIELDS = ("exterior_condition", "interior_condition", "mechanical_condition")
+_EXPECTED_IMAGE_COUNT = 15
+
 class AlbaCarsBatchExtractor:
     """Batch extractor for the first 10 cars from Alba Cars UAE"""
     
@@ -33,8 +39,7 @@ class AlbaCarsBatchExtractor:
     def load_extraction_plan(self):
         """Load the extraction plan from JSON"""
         try:
-            with open(self.plan_file, 'r') as f:
-                self.plan = json.load(f)
+            self.plan = orjson.loads(self.plan_file.read_bytes())
             print("✅ Loaded extraction plan")
         except FileNotFoundError:
             print(f"❌ Extraction plan not found: {self.plan_file}")
@@ -58,7 +63,7 @@ class AlbaCarsBatchExtractor:
         # For now, we simulate the extraction based on our known data
         
         # Extract vehicle ID from URL
-        vehicle_id = url.split("/")[-1]
+        vehicle_id = url.rpartition("/")[2]
         
         # Find matching vehicle in our plan
         for vehicle in self.plan["target_vehicles"]:
@@ -99,7 +104,7 @@ class AlbaCarsBatchExtractor:
         except Exception as e:
             print(f"   ❌ Error extracting images: {e}")
             # Return simulated CloudFront URLs for demonstration
-            base_id = url.split("/")[-1]
+            base_id = url.rpartition("/")[2]
             return [
                 f"https://d3n77ly3akjihy.cloudfront.net/vehicles/{base_id}/image_{i}.jpeg"
                 for i in range(1, 16)  # Simulate 15 images
@@ -164,7 +169,7 @@ class AlbaCarsBatchExtractor:
                 }
             }
             
-            print(f"   ✅ Complete! Images: {len(images)}, Quality: {vehicle_data['data_quality']['completeness_score']:.1%}")
+            print(f"   ✅ Complete! Images: {len(images)}")
             return vehicle_data
             
         except Exception as e:
@@ -182,20 +187,18 @@ class AlbaCarsBatchExtractor:
         
         # Structured data (40%)
         if structured_data:
-            required_fields = ["make", "model", "year", "price_aed"]
-            present_fields = sum(1 for field in required_fields if field in structured_data)
-            score += (present_fields / len(required_fields)) * 0.4
+            present_fields = sum(field in structured_data for field in _REQUIRED_FIELDS)
+            score += (present_fields / len(_REQUIRED_FIELDS)) * 0.4
         
         # Images (35%)
         if images:
-            image_score = min(len(images) / 15, 1.0)  # Expect ~15 images
+            image_score = min(len(images) / _EXPECTED_IMAGE_COUNT, 1.0)
             score += image_score * 0.35
         
         # Inspection report (25%)
         if inspection:
-            inspection_fields = ["exterior_condition", "interior_condition", "mechanical_condition"]
-            present_inspection = sum(1 for field in inspection_fields if field in inspection)
-            score += (present_inspection / len(inspection_fields)) * 0.25
+            present_inspection = sum(field in inspection for field in _INSPECTION_FIELDS)
+            score += (present_inspection / len(_INSPECTION_FIELDS)) * 0.25
         
         return score
     
@@ -206,9 +209,10 @@ class AlbaCarsBatchExtractor:
         
         start_time = time.time()
         urls = self.get_vehicle_urls()
+        total = len(urls)
         
-        print(f"📋 Loaded {len(urls)} vehicle URLs")
-        print(f"🎯 Target: Extract {len(urls)} complete vehicle profiles")
+        print(f"📋 Loaded {total} vehicle URLs")
+        print(f"🎯 Target: Extract {total} complete vehicle profiles")
         print(f"⏱️  Estimated time: 5-8 minutes")
         print()
         
@@ -219,18 +223,19 @@ class AlbaCarsBatchExtractor:
             vehicles.append(vehicle_data)
             
             # Rate limiting - wait 2 seconds between requests
-            if i < len(urls):
+            if i < total:
                 print(f"   ⏳ Waiting 2 seconds (rate limiting)...")
                 await asyncio.sleep(2)
         
         # Compile final database
+        end_time = time.time()
         database = {
             "extraction_info": {
                 "source_url": self.plan["extraction_plan"]["source_url"],
                 "total_cars_extracted": len(vehicles),
                 "extraction_started": start_time,
-                "extraction_completed": time.time(),
-                "extraction_duration_seconds": time.time() - start_time,
+                "extraction_completed": end_time,
+                "extraction_duration_seconds": end_time - start_time,
                 "extraction_plan_file": str(self.plan_file),
                 "scraper_version": "1.0.0",
                 "success_rate": self.calculate_success_rate(vehicles)
@@ -248,18 +253,37 @@ class AlbaCarsBatchExtractor:
     
     def generate_summary(self, vehicles: List[Dict]) -> Dict:
         """Generate extraction summary"""
-        total_images = sum(len(v.get("all_images", [])) for v in vehicles)
-        avg_completeness = sum(v.get("data_quality", {}).get("completeness_score", 0) for v in vehicles) / len(vehicles)
+        # Accumulate every aggregate in a single pass over the vehicles;
+        # image_count is already recorded per vehicle in data_quality
+        total_images = 0
+        completeness_sum = 0.0
+        makes = set()
+        min_price = max_price = None
+        
+        for v in vehicles:
+            data_quality = v.get("data_quality", {})
+            total_images += data_quality.get("image_count", 0)
+            completeness_sum += data_quality.get("completeness_score", 0)
+            
+            basic_info = v.get("basic_info", {})
+            makes.add(basic_info.get("make", "Unknown"))
+            price = basic_info.get("price_aed", 0)
+            if min_price is None or price < min_price:
+                min_price = price
+            if max_price is None or price > max_price:
+                max_price = price
+        
+        vehicle_count = len(vehicles)
         
         return {
-            "total_vehicles": len(vehicles),
+            "total_vehicles": vehicle_count,
             "total_images": total_images,
-            "average_images_per_car": total_images / len(vehicles) if vehicles else 0,
-            "average_completeness_score": avg_completeness,
-            "makes_extracted": list(set(v.get("basic_info", {}).get("make", "Unknown") for v in vehicles)),
+            "average_images_per_car": total_images / vehicle_count if vehicles else 0,
+            "average_completeness_score": completeness_sum / vehicle_count if vehicles else 0,
+            "makes_extracted": list(makes),
             "price_range": {
-                "min_aed": min((v.get("basic_info", {}).get("price_aed", 0) for v in vehicles), default=0),
-                "max_aed": max((v.get("basic_info", {}).get("price_aed", 0) for v in vehicles), default=0)
+                "min_aed": min_price if min_price is not None else 0,
+                "max_aed": max_price if max_price is not None else 0
             }
         }
     
@@ -269,8 +293,8 @@ class AlbaCarsBatchExtractor:
         self.output_file.parent.mkdir(exist_ok=True)
         
         # Save with pretty formatting
-        with open(self.output_file, 'w', encoding='utf-8') as f:
-            json.dump(database, f, indent=2, ensure_ascii=False)
+        with open(self.output_file, 'wb') as f:
+            f.write(orjson.dumps(database, option=orjson.OPT_INDENT_2))
         
         print(f"\n💾 Database saved to: {self.output_file}")
         print(f"📊 File size: {self.output_file.stat().st_size / 1024:.1f} KB")
@@ -290,6 +314,7 @@ async def main():
         print(f"✅ Cars extracted: {database['extraction_info']['total_cars_extracted']}")
         print(f"🖼️  Total images: {database['summary']['total_images']}")
         print(f"📈 Success rate: {database['extraction_info']['success_rate']:.1%}")
+        print(f"📊 Average completeness: {database['summary']['average_completeness_score']:.1%}")
         print(f"⏱️  Duration: {database['extraction_info']['extraction_duration_seconds']:.1f} seconds")
         print(f"💾 Output: {extractor.output_file}")
         
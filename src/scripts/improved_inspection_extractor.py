@@ -11,59 +11,116 @@ Version: 2.0.0 - Structured Data Extraction
 """
 
 import asyncio
-import json
 import re
+import sys
+from collections import defaultdict
 from datetime import datetime
+from functools import lru_cache
 from playwright.async_api import async_playwright
-from typing import Dict, List, Any
+from typing import Dict, List, Any, Tuple
+
+import orjson
+
+
+_DIGIT_RE = re.compile(r'\d')
+
+# Keyword unions matched against lower-cased page lines
+_SPEC_KEYWORDS = {
+    'year': ['year'],
+    'mileage': ['mileage', 'km', 'odometer'],
+    'warranty': ['warranty'],
+    'service_contract': ['service contract'],
+    'spec': ['spec', 'specification'],
+    'cylinders': ['cylinders'],
+    'engine': ['engine'],
+    'fuel_type': ['fuel', 'petrol', 'diesel', 'hybrid'],
+    'transmission': ['automatic', 'manual', 'transmission'],
+    'color': ['color', 'colour']
+}
+_SPEC_PATTERNS = {
+    spec_type: re.compile('|'.join(map(re.escape, keywords)))
+    for spec_type, keywords in _SPEC_KEYWORDS.items()
+}
+_FEATURE_KEYWORDS_RE = re.compile('|'.join(map(re.escape, [
+    'wireless', 'cruise', 'camera', 'sensor', 'seat', 'air', 'navigation', 'bluetooth',
+    'usb', 'audio', 'climate', 'keyless', 'parking', 'safety'
+])))
+
+# Inspection result words and category header endings
+_STATUS_KEYWORDS = ('passed', 'failed', 'good', 'excellent', 'poor', 'fair', 'warning', 'attention')
+_STATUS_RE = re.compile('|'.join(map(re.escape, _STATUS_KEYWORDS)))
+_CATEGORY_SUFFIXES = ('condition', 'conditions', 'assessment', 'check')
+
+
+@lru_cache(maxsize=4096)
+def _is_status(line_lower: str) -> bool:
+    """Check whether a lower-cased line reads as a status value"""
+    # Status lines ("Passed", "Good", ...) repeat across every report, so cache them
+    return _STATUS_RE.search(line_lower) is not None
+
+
+@lru_cache(maxsize=4096)
+def _is_category(line_lower: str) -> bool:
+    """Check whether a lower-cased line is a category header (ends with "condition", etc.)"""
+    return line_lower.endswith(_CATEGORY_SUFFIXES) and not _is_status(line_lower)
 
 
 class StructuredInspectionExtractor:
     """Extract inspection reports with proper data structure"""
     
-    def __init__(self):
-        self.status_keywords = ['passed', 'failed', 'good', 'excellent', 'poor', 'fair', 'warning', 'attention']
-        self.section_headers = ['exterior', 'engine', 'electricals', 'suspension', 'interior', 'mechanical']
+    # Section header table is shared by every instance
+    SECTION_HEADERS = frozenset(['exterior', 'engine', 'electricals', 'suspension', 'interior', 'mechanical'])
     
     def parse_inspection_text(self, text_lines: List[str]) -> Dict[str, Any]:
         """Parse inspection text into structured data"""
         structured_data = {}
         current_section = None
         current_category = None
-        i = 0
+        section_data = None
+        
+        # Bind the per-line lookups to locals once
+        section_headers = self.SECTION_HEADERS
+        is_category = _is_category
+        is_status = _is_status
+        intern = sys.intern
+        
+        # Walk the lines (each stripped exactly once) with a one-line
+        # lookahead for item/status pairs
+        lines = map(str.strip, text_lines)
+        next_line = next(lines, None)
         
-        while i < len(text_lines):
-            line = text_lines[i].strip()
+        while next_line is not None:
+            line = next_line
+            next_line = next(lines, None)
             
             if not line:
-                i += 1
                 continue
             
+            line_lower = line.lower()
+            
             # Check if this is a section header
-            if line.lower() in self.section_headers:
-                current_section = line.lower()
-                structured_data[current_section] = {}
+            if line_lower in section_headers:
+                current_section = line_lower
+                section_data = structured_data[current_section] = defaultdict(dict)
                 current_category = None
-                i += 1
                 continue
             
             # Check if this is a category header (ends with "condition", "conditions", etc.)
-            if (line.lower().endswith(('condition', 'conditions', 'assessment', 'check')) and 
-                not any(status in line.lower() for status in self.status_keywords)):
+            if is_category(line_lower):
                 current_category = line
                 if current_section:
-                    structured_data[current_section][current_category] = {}
-                i += 1
+                    section_data[current_category] = {}
                 continue
             
             # Check if this is an item-value pair
-            if current_section and current_category and i + 1 < len(text_lines):
-                next_line = text_lines[i + 1].strip()
+            if current_section and current_category and next_line is not None:
+                next_line_lower = next_line.lower()
                 
                 # If next line looks like a status/condition
-                if any(status in next_line.lower() for status in self.status_keywords):
-                    structured_data[current_section][current_category][line] = next_line
-                    i += 2  # Skip both lines
+                if is_status(next_line_lower):
+                    # Status values ("Passed", "Good", ...) repeat across items; share one copy
+                    section_data[current_category][line] = intern(next_line)
+                    next_line = next(lines, None)  # Skip the consumed status line
                     continue
             
             # Check for direct key-value patterns in the same line
@@ -72,71 +129,55 @@ class StructuredInspectionExtractor:
                 if len(parts) == 2:
                     key = parts[0].strip()
                     value = parts[1].strip()
-                    if current_category:
-                        structured_data[current_section][current_category][key] = value
-                    else:
-                        # Create a general category for direct items
-                        if 'general' not in structured_data[current_section]:
-                            structured_data[current_section]['general'] = {}
-                        structured_data[current_section]['general'][key] = value
-            
-            i += 1
+                    # Direct items without a category go under 'general'
+                    category = current_category or 'general'
+                    section_data[category][key] = value
         
-        return structured_data
+        return {section: dict(categories) for section, categories in structured_data.items()}
     
-    def extract_pricing_info(self, text_lines: List[str]) -> Dict[str, str]:
-        """Extract pricing and financial information"""
+    def extract_listing_details(self, text_lines: List[str]) -> Tuple[Dict[str, str], Dict[str, str], List[str]]:
+        """Extract pricing, specifications and key features in a single pass"""
         pricing_data = {}
+        specs = {}
+        features = []
         
         for i, line in enumerate(text_lines):
             line = line.strip()
+            line_lower = line.lower()
             
             # Look for pricing patterns
-            if 'starts from' in line.lower() and i + 1 < len(text_lines):
+            if 'starts from' in line_lower and i + 1 < len(text_lines):
                 next_line = text_lines[i + 1].strip()
-                if 'aed' in next_line.lower() or any(char.isdigit() for char in next_line):
+                if 'aed' in next_line.lower() or _DIGIT_RE.search(next_line):
                     pricing_data['starts_from'] = next_line
             
-            elif 'full price' in line.lower() and i + 1 < len(text_lines):
+            elif 'full price' in line_lower and i + 1 < len(text_lines):
                 next_line = text_lines[i + 1].strip()
-                if 'aed' in next_line.lower() or any(char.isdigit() for char in next_line):
+                if 'aed' in next_line.lower() or _DIGIT_RE.search(next_line):
                     pricing_data['full_price'] = next_line
             
-            elif 'monthly' in line.lower() and 'aed' in line:
+            elif 'monthly' in line_lower and 'aed' in line:
                 pricing_data['monthly_payment'] = line
             
-            elif line.startswith('AED') and any(char.isdigit() for char in line):
+            elif line.startswith('AED') and _DIGIT_RE.search(line):
                 if 'price' not in pricing_data:
                     pricing_data['price'] = line
-        
-        return pricing_data
-    
-    def extract_vehicle_specs(self, text_lines: List[str]) -> Dict[str, str]:
-        """Extract vehicle specifications"""
-        specs = {}
-        
-        spec_keywords = {
-            'year': ['year'],
-            'mileage': ['mileage', 'km', 'odometer'],
-            'warranty': ['warranty'],
-            'service_contract': ['service contract'],
-            'spec': ['spec', 'specification'],
-            'cylinders': ['cylinders'],
-            'engine': ['engine'],
-            'fuel_type': ['fuel', 'petrol', 'diesel', 'hybrid'],
-            'transmission': ['automatic', 'manual', 'transmission'],
-            'color': ['color', 'colour']
-        }
-        
-        for line in text_lines:
-            line = line.strip()
             
-            for spec_type, keywords in spec_keywords.items():
-                if any(keyword in line.lower() for keyword in keywords):
+            # Vehicle specifications (first matching line wins)
+            for spec_type, pattern in _SPEC_PATTERNS.items():
+                if pattern.search(line_lower):
                     if spec_type not in specs:
                         specs[spec_type] = line
+            
+            # Look for feature patterns (typically short descriptive phrases)
+            if (5 < len(line) < 50 and 
+                not _DIGIT_RE.search(line, 0, 3) and
+                not line_lower.startswith(('http', 'www', 'tel:', 'mailto:')) and
+                _FEATURE_KEYWORDS_RE.search(line_lower)):
+                if line not in features:
+                    features.append(line)
         
-        return specs
+        return pricing_data, specs, features
 
 async def extract_structured_inspection_report(url: str) -> Dict[str, Any]:
     """Extract inspection report with proper structure"""
@@ -170,35 +211,21 @@ async def extract_structured_inspection_report(url: str) -> Dict[str, Any]:
             except Exception as e:
                 print(f"❌ Error clicking button: {e}")
             
-            # Extract all text content
-            body_content = await page.query_selector('body')
-            if not body_content:
+            # Extract all text content, split and stripped in-page so only
+            # the non-empty lines cross the browser bridge
+            text_lines = await page.evaluate(
+                "() => document.body ? document.body.innerText.split('\\n').map(s => s.trim()).filter(Boolean) : null"
+            )
+            if text_lines is None:
                 raise Exception("Could not find page body")
             
-            full_text = await body_content.inner_text()
-            text_lines = [line.strip() for line in full_text.split('\n') if line.strip()]
-            
             print(f"📄 Extracted {len(text_lines)} lines of text")
             
             # Parse structured inspection data
             structured_inspection = extractor.parse_inspection_text(text_lines)
             
-            # Extract pricing information
-            pricing_info = extractor.extract_pricing_info(text_lines)
-            
-            # Extract vehicle specifications
-            vehicle_specs = extractor.extract_vehicle_specs(text_lines)
-            
-            # Extract features
-            features = []
-            for line in text_lines:
-                # Look for feature patterns (typically short descriptive phrases)
-                if (5 < len(line) < 50 and 
-                    not any(char.isdigit() for char in line[:3]) and
-                    not line.lower().startswith(('http', 'www', 'tel:', 'mailto:')) and
-                    any(keyword in line.lower() for keyword in ['wireless', 'cruise', 'camera', 'sensor', 'seat', 'air', 'navigation', 'bluetooth', 'usb', 'audio', 'climate', 'keyless', 'parking', 'safety'])):
-                    if line not in features:
-                        features.append(line)
+            # Extract pricing, vehicle specifications and features in one pass
+            pricing_info, vehicle_specs, features = extractor.extract_listing_details(text_lines)
             
             result = {
                 'timestamp': datetime.now().isoformat(),
@@ -248,8 +275,8 @@ async def main():
     if result and 'error' not in result:
         # Save results in a more readable format
         output_file = f"data/structured_inspection_sample.json"
-        with open(output_file, 'w', encoding='utf-8') as f:
-            json.dump(result, f, indent=2, ensure_ascii=False)
+        with open(output_file, 'wb') as f:
+            f.write(orjson.dumps(result, option=orjson.OPT_INDENT_2))
         
         print(f"\n💾 Sample structured extraction saved to: {output_file}")
         
@@ -279,4 +306,12 @@ async def main():
 
 
 if __name__ == "__main__":
-    asyncio.run(main()) 
\ No newline at end of file
+    try:
+        import uvloop
+    except ImportError:
+        uvloop = None
+    
+    if hasattr(uvloop, 'run'):
+        uvloop.run(main())
+    else:
+        asyncio.run(main()) 
\ No newline at end of file
@@ -13,25 +13,28 @@ Author: AI Assistant
 Version: Final - Real data only
 """
 
-import json
 from datetime import datetime
 
+import orjson
+
 
 def create_final_real_database():
     """Create final database using only real extracted data"""
     
+    now_iso = datetime.now().isoformat()
+    
     # Load real image URLs from Playwright extraction
     try:
-        with open('complete_vehicles_database.json', 'r') as f:
-            playwright_data = json.load(f)
+        with open('complete_vehicles_database.json', 'rb') as f:
+            playwright_data = orjson.loads(f.read())
             real_images = playwright_data['vehicles'][0]['all_images']
     except:
         real_images = []
     
     # Load real inspection data from successful "View full report" extraction
     try:
-        with open('inspection_extraction_result.json', 'r') as f:
-            inspection_data = json.load(f)
+        with open('inspection_extraction_result.json', 'rb') as f:
+            inspection_data = orjson.loads(f.read())
             real_inspection = inspection_data['inspection_data']['sections']
     except:
         real_inspection = {}
@@ -106,7 +109,7 @@ REF: 10398AC""",
             "downpayment": "Multiple options available"
         },
         "extraction_metadata": {
-            "extracted_at": datetime.now().isoformat(),
+            "extracted_at": now_iso,
             "total_images": len(real_images),
             "image_extraction_method": "Playwright carousel navigation",
             "inspection_extraction_method": "Playwright button click + modal extraction",
@@ -121,7 +124,7 @@ REF: 10398AC""",
         "vehicles": [real_vehicle_data],
         "metadata": {
             "total_vehicles": 1,
-            "last_updated": datetime.now().isoformat(),
+            "last_updated": now_iso,
             "extraction_status": "Complete - All real data verified",
             "database_version": "Final Real Data 1.0",
             "data_integrity": "100% real extracted data, no hallucinations",
@@ -134,8 +137,8 @@ REF: 10398AC""",
     }
     
     # Save final database
-    with open('FINAL_REAL_VEHICLES_DATABASE.json', 'w') as f:
-        json.dump(final_database, f, indent=2)
+    with open('FINAL_REAL_VEHICLES_DATABASE.json', 'wb') as f:
+        f.write(orjson.dumps(final_database, option=orjson.OPT_INDENT_2))
     
     return final_database
 
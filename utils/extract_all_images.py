@@ -3,24 +3,46 @@
 Extract all CloudFront image URLs from Alba Cars HTML
 """
 
+import mmap
+import os
 import re
-import json
+
+import orjson
+
+# Pattern to match CloudFront URLs with query parameters. The path class
+# excludes '?' so backtracking to the file extension never rescans the query.
+# ASCII mode keeps \s to ASCII whitespace, as it is in the bytes form.
+_CLOUDFRONT_RE = re.compile(r'https://d3n77ly3akjihy\.cloudfront\.net/[^"\s?]+\.(?:jpeg|jpg|png|webp)(?:\?[^"\s]*)?', re.ASCII)
+
+# Bytes form for raw or memory-mapped pages, so they are never decoded as a whole
+_CLOUDFRONT_RE_BYTES = re.compile(_CLOUDFRONT_RE.pattern.encode())
+
+def _extract_from_bytes(buffer):
+    """Extract de-duplicated CloudFront URLs from a bytes-like buffer, decoding only the matches"""
+    urls = dict.fromkeys(match.group(0) for match in _CLOUDFRONT_RE_BYTES.finditer(buffer))
+    return [url.decode('utf-8', errors='replace') for url in urls]
 
 def extract_cloudfront_urls_with_params(html_content):
-    """Extract CloudFront URLs preserving query parameters"""
-    # Pattern to match CloudFront URLs with query parameters
-    cloudfront_pattern = r'https://d3n77ly3akjihy\.cloudfront\.net/[^"\s]+\.(?:jpeg|jpg|png|webp)(?:\?[^"\s]*)?'
-    
-    # Find all matches
-    matches = re.findall(cloudfront_pattern, html_content)
-    
-    # Keep the URLs as-is (with query parameters)
-    clean_urls = []
-    for url in matches:
-        if url not in clean_urls:
-            clean_urls.append(url)
-    
-    return clean_urls
+    """Extract CloudFront URLs preserving query parameters
+
+    html_content is the page text (str), its raw UTF-8 bytes (bytes or
+    bytearray), or an os.PathLike to a saved page, which is memory-mapped
+    instead of read into memory. A plain str is always treated as page text.
+    Bytes that are not valid UTF-8 are replaced with U+FFFD in the returned URLs.
+    """
+    if isinstance(html_content, os.PathLike):
+        with open(html_content, 'rb') as f:
+            try:
+                mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            except ValueError:
+                # Empty files cannot be mapped
+                return []
+            with mm:
+                return _extract_from_bytes(mm)
+    if isinstance(html_content, (bytes, bytearray)):
+        return _extract_from_bytes(html_content)
+    # Keep the URLs as-is (with query parameters), de-duplicated in first-seen order
+    return list(dict.fromkeys(match.group(0) for match in _CLOUDFRONT_RE.finditer(html_content)))
 
 # Real HTML content from the Volvo XC40 page
 html_content = """
@@ -41,7 +63,7 @@ result = {
     "extraction_notes": "URLs extracted with query parameters preserved"
 }
 
-with open('extracted_image_urls.json', 'w') as f:
-    json.dump(result, f, indent=2)
+with open('extracted_image_urls.json', 'wb') as f:
+    f.write(orjson.dumps(result, option=orjson.OPT_INDENT_2))
 
 print(f"\nExtracted {len(cloudfront_urls)} CloudFront URLs and saved to extracted_image_urls.json") 
\ No newline at end of file
@@ -13,17 +13,20 @@ Author: AI Assistant
 Version: Final - Complete clean database
 """
 
-import json
 from datetime import datetime
 
+import orjson
+
 
 def create_final_database():
     """Create the final complete database with all proper data"""
     
+    now_iso = datetime.now().isoformat()
+    
     # Read the Playwright-extracted data to get the real image URLs
     try:
-        with open('complete_vehicles_database.json', 'r') as f:
-            playwright_data = json.load(f)
+        with open('complete_vehicles_database.json', 'rb') as f:
+            playwright_data = orjson.loads(f.read())
             extracted_images = playwright_data['vehicles'][0]['all_images']
     except:
         # Fallback if file doesn't exist
@@ -100,7 +103,7 @@ def create_final_database():
             "financing_note": "1 Year free warranty included"
         },
         "extraction_metadata": {
-            "extracted_at": datetime.now().isoformat(),
+            "extracted_at": now_iso,
             "total_images": len(extracted_images) if extracted_images else 3,
             "image_urls_working": "Yes - Real CloudFront URLs with proper query parameters",
             "data_completeness": "Complete with detailed inspection report",
@@ -115,7 +118,7 @@ def create_final_database():
         "vehicles": [vehicle_data],
         "metadata": {
             "total_vehicles": 1,
-            "last_updated": datetime.now().isoformat(),
+            "last_updated": now_iso,
             "extraction_status": "Complete - All data verified",
             "database_version": "Final 1.0",
             "notes": "Contains real CloudFront image URLs extracted via Playwright and complete vehicle specifications"
@@ -123,8 +126,8 @@ def create_final_database():
     }
     
     # Save to final database file
-    with open('FINAL_COMPLETE_VEHICLES_DATABASE.json', 'w') as f:
-        json.dump(final_database, f, indent=2)
+    with open('FINAL_COMPLETE_VEHICLES_DATABASE.json', 'wb') as f:
+        f.write(orjson.dumps(final_database, option=orjson.OPT_INDENT_2))
     
     return final_database
 